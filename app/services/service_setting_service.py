@@ -9,6 +9,9 @@ from app.utils.auth import JWTPayload, has_role
 
 logger = logging.getLogger(__name__)
 
+# Roles allowed to change tenant service assignments
+GLOBAL_ADMIN_ROLES = frozenset({"global_admin"})
+
 
 class ServiceSettingService:
     """Service setting business logic"""
@@ -39,7 +42,7 @@ class ServiceSettingService:
     ) -> TenantService:
         """Assign a service to a tenant"""
         # Permission check: Only global_admin
-        if not has_role(current_user, ["global_admin"]):
+        if not has_role(current_user, GLOBAL_ADMIN_ROLES):
             raise HTTPException(
                 status_code=403,
                 detail="Only global admin can assign services to tenants"
@@ -73,7 +76,7 @@ class ServiceSettingService:
     ) -> bool:
         """Unassign a service from a tenant"""
         # Permission check: Only global_admin
-        if not has_role(current_user, ["global_admin"]):
+        if not has_role(current_user, GLOBAL_ADMIN_ROLES):
             raise HTTPException(
                 status_code=403,
                 detail="Only global admin can unassign services from tenants"
@@ -1,6 +1,6 @@
 """Authentication utilities"""
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Collection, List, Optional
 
 
 class Role(BaseModel):
@@ -20,6 +20,6 @@ class JWTPayload(BaseModel):
     iat: Optional[int] = None
 
 
-def has_role(user: JWTPayload, role_codes: List[str]) -> bool:
+def has_role(user: JWTPayload, role_codes: Collection[str]) -> bool:
     """Check if user has any of the specified roles"""
     return any(role.role_code in role_codes for role in user.roles)
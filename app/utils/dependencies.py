@@ -2,7 +2,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Dict
-from jose import jwt, JWTError
+from jose import jwk, jwt, JWTError
 
 from app.config import get_settings
 from app.utils.auth import JWTPayload, Role
@@ -10,13 +10,16 @@ from app.utils.auth import JWTPayload, Role
 settings = get_settings()
 security = HTTPBearer()
 
+# Parse the verification key once instead of on every request
+verification_key = jwk.construct(settings.jwt_secret, settings.jwt_algorithm)
+
 
 def verify_jwt_token(token: str) -> Dict:
     """Verify JWT token"""
     try:
         payload = jwt.decode(
             token,
-            settings.jwt_secret,
+            verification_key,
             algorithms=[settings.jwt_algorithm]
         )
         return payload
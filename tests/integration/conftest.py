@@ -2,6 +2,7 @@
 Integration test configuration and fixtures
 """
 import os
+import time
 import pytest
 from typing import Generator
 from fastapi.testclient import TestClient
@@ -16,10 +17,13 @@ TEST_COSMOS_KEY = os.getenv("COSMOS_KEY", "")
 TEST_ADMIN_TOKEN = os.getenv("TEST_ADMIN_TOKEN", "")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client() -> Generator:
     """
     Create a test client for the FastAPI application
+
+    Shared across the session so startup/shutdown (and the Cosmos DB
+    client they manage) run once rather than per test.
     """
     from app.main import app
     
@@ -38,24 +42,57 @@ async def async_test_client() -> Generator:
         yield client
 
 
-@pytest.fixture
-def auth_headers() -> dict:
+@pytest.fixture(scope="session")
+def admin_token() -> str:
+    """
+    Get an admin token, signed at most once per session
+
+    Uses TEST_ADMIN_TOKEN when provided; otherwise signs a global_admin
+    token with TEST_JWT_SECRET (the service must run with the same
+    JWT_SECRET to accept it).
+    """
+    if TEST_ADMIN_TOKEN:
+        return TEST_ADMIN_TOKEN
+
+    from jose import jwt
+
+    now = int(time.time())
+    payload = {
+        "user_id": "test-admin-user",
+        "tenant_id": "test-admin-tenant",
+        "roles": [
+            {
+                "service_id": "auth-service",
+                "service_name": "認証認可サービス",
+                "role_code": "global_admin",
+                "role_name": "全体管理者",
+            }
+        ],
+        "iat": now,
+        "exp": now + 3600,
+    }
+    return jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")
+
+
+@pytest.fixture(scope="session")
+def auth_headers(admin_token: str) -> dict:
     """
     Get authorization headers with admin token
     """
-    token = TEST_ADMIN_TOKEN or "mock-jwt-token-for-testing"
     return {
-        "Authorization": f"Bearer {token}"
+        "Authorization": f"Bearer {admin_token}"
     }
 
 
-def pytest_configure(config):
+@pytest.fixture(scope="session")
+def available_services(test_client: TestClient, auth_headers: dict) -> list:
     """
-    Configure pytest with custom markers
+    Get the service list once and share it across tests
     """
-    config.addinivalue_line(
-        "markers", "integration: mark test as integration test"
-    )
-    config.addinivalue_line(
-        "markers", "slow: mark test as slow running"
+    response = test_client.get(
+        "/api/v1/services",
+        headers=auth_headers
     )
+    if response.status_code != 200:
+        return []
+    return response.json().get("data", [])